@@ -1,17 +1,142 @@
 import pandas as pd
-import matplotlib.pyplot as plt
-import seaborn as sns
 import numpy as np
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from functools import cached_property, lru_cache, wraps
+import importlib.util
+import json
+from multiprocessing import get_context
 import os
+import sys
+
+# pyarrow is only a read_csv engine; probe for it without paying its import cost
+CSV_ENGINE = 'pyarrow' if importlib.util.find_spec('pyarrow') else 'c'
+
+# Measured on one CPU with the on-disk kernel cache warm: the kernel's first
+# call in a process (the only one load_data makes) costs ~0.3s plus ~6.5ns/row,
+# against ~20ns/row for NumPy (0.35s vs 0.02s at 1.2M rows, 0.43s vs 0.40s at
+# 20M). It only wins above roughly this many rows.
+NUMBA_MIN_ROWS = 25_000_000
+
+@lru_cache(maxsize=None)
+def _totals_and_rate_kernel():
+    """Import numba and return the compiled kernel, or None if numba is missing"""
+    try:
+        import numba
+    except ImportError:
+        return None
+    
+    # error_model='numpy' makes a zero population give inf like the NumPy path
+    @numba.njit(parallel=True, error_model='numpy', cache=True)
+    def kernel(murder, rape, kidnapping, robbery, theft, riots, pop, out_total, out_rate):
+        """Fill Total_Crimes and Crime_Rate in a single parallel pass"""
+        for i in numba.prange(murder.shape[0]):
+            t = murder[i] + rape[i] + kidnapping[i] + robbery[i] + theft[i] + riots[i]
+            out_total[i] = t
+            # Population is in lakhs, so crimes per 100,000 is simply t / pop
+            out_rate[i] = t / pop[i]
+    
+    return kernel
+
+# CSVs larger than CSV_STREAM_BYTES are streamed in pieces of roughly
+# CSV_CHUNK_BYTES of text instead of being read in one go
+CSV_STREAM_BYTES = 64 * 1024 * 1024
+CSV_CHUNK_BYTES = 8 * 1024 * 1024
+
+PLOT_CACHE_FILE = '_plot_cache.json'
+
+# A spawned render worker needs ~1.5s to start and import this module, while
+# most charts take ~0.25s whatever the data size. Only the one-bar-per-state
+# chart grows with the row count (~5s at 1,000 states), so a pool pays off
+# only for large data on a multi-core machine.
+PARALLEL_RENDER_MIN_ROWS = 1000
+
+SCREEN_DPI = 100
+PUBLISH_DPI = 300
+
+# One colour per crime category, in CrimeAnalysisSystem.CRIME_COLS order
+CATEGORY_COLORS = ('#ff6b6b', '#ee5a6f', '#c44569', '#4a69bd', '#60a3bc', '#f8b500')
+
+# matplotlib/seaborn are imported on the first plot (see _ensure_plotting), so
+# loading and displaying the data does not pay their import cost
+plt = None
+sns = None
+
+def _ensure_plotting():
+    """Import the plotting libraries and set the plot style, once"""
+    global plt, sns
+    if plt is None:
+        import matplotlib.pyplot as plt
+        import seaborn as sns
+        # Set style for better-looking plots
+        plt.style.use('seaborn-v0_8-darkgrid')
+        sns.set_palette("husl")
+
+@lru_cache(maxsize=8)
+def _rdylgn_colors(n):
+    """Red (high) to green (low) bar colours for n states (shared, read-only)"""
+    _ensure_plotting()
+    colors = plt.cm.RdYlGn_r(np.linspace(0.2, 0.8, n))
+    colors.setflags(write=False)
+    return colors
+
+def cache_plot(filename):
+    """Skip re-rendering a saved plot when the data behind it is unchanged
+    
+    Only batch renders (show=False) are short-circuited; an interactive
+    request still has to build the figure to display it.
+    """
+    def decorator(method):
+        @wraps(method)
+        def wrapper(self, show=True):
+            name = method.__name__
+            if not show and self._plot_is_current(name):
+                print(f"✓ Up to date: {filename}")
+                return
+            _ensure_plotting()
+            method(self, show=show)
+            self._record_plot(name)
+        wrapper.plot_file = filename
+        return wrapper
+    return decorator
+
+def _render_plot(df, name, dpi):
+    """Process-pool worker: render one plot off-screen from a processed DataFrame"""
+    _ensure_plotting()
+    plt.switch_backend('Agg')
+    system = CrimeAnalysisSystem(df=df, dpi=dpi)
+    # Bypass cache_plot; the parent process owns the manifest
+    getattr(CrimeAnalysisSystem, name).__wrapped__(system, show=False)
 
 class CrimeAnalysisSystem:
     """Main class for crime rate analysis with CSV data"""
     
-    def __init__(self, csv_file='crime_data.csv'):
+    CRIME_COLS = ['Murder', 'Rape', 'Kidnapping', 'Robbery', 'Theft', 'Riots']
+    # Counts never come close to int32 limits, so int64 would only double the memory
+    COMPACT_DTYPES = dict.fromkeys(CRIME_COLS + ['Population_Lakhs'], 'int32')
+    # Derived views memoized per data load; cleared by load_data()
+    _CACHED_VIEWS = ('_sorted_by_rate', '_top10_rate', '_bottom10_rate',
+                     '_top15_total', '_top5_rate', '_df_hash', '_rate_summary',
+                     '_formatted_table')
+    PLOT_METHODS = ('plot_crime_rate_by_state', 'plot_crime_categories',
+                    'plot_top_bottom_states', 'plot_heatmap',
+                    'plot_population_vs_crime', 'plot_statistical_summary')
+    
+    def __init__(self, csv_file='crime_data.csv', df=None, dpi=SCREEN_DPI):
         self.csv_file = csv_file
+        self.dpi = dpi
         self.df = None
-        self.load_data()
+        
+        pd.set_option('display.max_columns', None)
+        pd.set_option('display.width', None)
+        pd.set_option('display.max_rows', None)
+        
+        self._plot_manifest = self._load_plot_manifest()
+        if df is None:
+            self.load_data()
+        else:
+            # Already processed elsewhere (e.g. handed to a render worker)
+            self.df = df
     
     def create_sample_csv(self):
         """Create a sample CSV file if it doesn't exist"""
@@ -43,21 +168,23 @@ class CrimeAnalysisSystem:
     
     def load_data(self):
         """Load crime data from CSV file"""
+        self._invalidate_cache()
         try:
             if not os.path.exists(self.csv_file):
                 print(f"⚠️  CSV file '{self.csv_file}' not found. Creating sample data...")
-                self.df = self.create_sample_csv()
+                self.df = self._downcast_counts(self.create_sample_csv())
+                # Calculate total crimes and crime rate
+                self._add_derived_columns(self.df)
             else:
-                self.df = pd.read_csv(self.csv_file)
+                self.df = self._read_csv()
                 print(f"✓ Loaded data from {self.csv_file} successfully!")
             
-            # Calculate total crimes and crime rate
-            self.df['Total_Crimes'] = (self.df['Murder'] + self.df['Rape'] + 
-                                       self.df['Kidnapping'] + self.df['Robbery'] + 
-                                       self.df['Theft'] + self.df['Riots'])
+            missing = [col for col in self.COMPACT_DTYPES if self.df[col].isna().any()]
+            if missing:
+                print(f"⚠️  Blank values in {', '.join(missing)}; totals for those rows will be NaN")
             
-            self.df['Crime_Rate'] = (self.df['Total_Crimes'] / 
-                                    (self.df['Population_Lakhs'] * 100000)) * 100000
+            # State is only ever used as a label, so store it as codes + categories
+            self.df['State'] = self.df['State'].astype('category')
             
             print(f"✓ Processed data for {len(self.df)} states")
             
@@ -65,28 +192,204 @@ class CrimeAnalysisSystem:
             print(f"❌ Error loading data: {e}")
             raise
     
+    def _read_csv(self):
+        """Read the CSV with derived columns, streaming it in chunks when large"""
+        if os.path.getsize(self.csv_file) <= CSV_STREAM_BYTES:
+            df = self._downcast_counts(pd.read_csv(self.csv_file, engine=CSV_ENGINE))
+            self._add_derived_columns(df)
+            return df
+        
+        # Each chunk is downcast before the next one is parsed, so the whole file
+        # is never held at parse-time dtypes. The chunk list and the concat
+        # result do coexist, so peak memory is about twice the compact frame.
+        chunks = [self._downcast_counts(chunk) for chunk in self._iter_csv_chunks()]
+        if self._derivation_kernel(sum(map(len, chunks)), chunks) is None:
+            # NumPy path: derive per chunk so its temporaries stay chunk-sized
+            for chunk in chunks:
+                self._add_derived_columns(chunk)
+            return pd.concat(chunks, ignore_index=True)
+        
+        # The kernel only allocates its two output columns, so run it once on
+        # the whole frame where it is fast enough to pay for its first call
+        df = pd.concat(chunks, ignore_index=True)
+        del chunks
+        self._add_derived_columns(df)
+        return df
+    
+    def _iter_csv_chunks(self):
+        """Yield the CSV as DataFrames of roughly CSV_CHUNK_BYTES of text each"""
+        if CSV_ENGINE == 'pyarrow':
+            # pandas' pyarrow engine cannot chunk, so stream with pyarrow directly
+            import pyarrow as pa
+            from pyarrow import csv
+            options = csv.ReadOptions(block_size=CSV_CHUNK_BYTES)
+            # The stream fixes column types from its first block, so read counts
+            # as float64 to accept later blanks or fractions; downcast afterwards
+            convert = csv.ConvertOptions(
+                column_types=dict.fromkeys(self.COMPACT_DTYPES, pa.float64()))
+            for batch in csv.open_csv(self.csv_file, read_options=options,
+                                      convert_options=convert):
+                yield batch.to_pandas()
+            return
+        
+        # The C parser chunks by rows; estimate rows per chunk from the first lines
+        with open(self.csv_file, 'rb') as f:
+            f.readline()
+            sample = f.readlines(64 * 1024)
+        bytes_per_row = max(1, sum(map(len, sample)) // max(1, len(sample)))
+        rows_per_chunk = max(1, CSV_CHUNK_BYTES // bytes_per_row)
+        yield from pd.read_csv(self.csv_file, chunksize=rows_per_chunk)
+    
+    def _downcast_counts(self, df):
+        """Return df with whole-number count columns as int32
+        
+        Columns with blank cells or fractional values (e.g. populations)
+        keep their float dtype, so no value is truncated.
+        """
+        def is_whole(values):
+            if values.dtype.kind == 'i':
+                return True
+            return (values.dtype.kind == 'f' and values.notna().all()
+                    and (values % 1 == 0).all())
+        
+        return df.astype({col: dtype for col, dtype in self.COMPACT_DTYPES.items()
+                          if is_whole(df[col])})
+    
+    def _derivation_kernel(self, n_rows, frames):
+        """Return the Numba kernel if it should derive these rows, else None"""
+        if n_rows < NUMBA_MIN_ROWS:
+            return None
+        # The kernel writes int64 totals, so NaN-bearing float columns are excluded
+        if not all(frame[col].dtype.kind == 'i'
+                   for frame in frames for col in self.COMPACT_DTYPES):
+            return None
+        return _totals_and_rate_kernel()
+    
+    def _add_derived_columns(self, df):
+        """Add Total_Crimes and Crime_Rate (per 100,000 population) to df in place"""
+        kernel = self._derivation_kernel(len(df), [df])
+        if kernel is not None:
+            total = np.empty(len(df), dtype=np.int64)
+            rate = np.empty(len(df), dtype=np.float32)
+            kernel(*(df[col].to_numpy() for col in self.CRIME_COLS),
+                   df['Population_Lakhs'].to_numpy(), total, rate)
+            df['Total_Crimes'] = total
+            df['Crime_Rate'] = rate
+            return
+        
+        df['Total_Crimes'] = df[self.CRIME_COLS].to_numpy().sum(axis=1)
+        
+        df['Crime_Rate'] = (df['Total_Crimes'].to_numpy() / 
+                           (df['Population_Lakhs'].to_numpy(dtype=np.float64) * 100000)) * 100000
+        df['Crime_Rate'] = df['Crime_Rate'].astype('float32')
+    
+    def _invalidate_cache(self):
+        """Drop memoized views so they are rebuilt from the current data"""
+        for name in self._CACHED_VIEWS:
+            self.__dict__.pop(name, None)
+    
+    @staticmethod
+    def _load_plot_manifest():
+        """Read the rendered-plot manifest, starting fresh if it is unusable"""
+        try:
+            with open(PLOT_CACHE_FILE) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+    
+    def _save_plot_manifest(self):
+        with open(PLOT_CACHE_FILE, 'w') as f:
+            json.dump(self._plot_manifest, f, indent=2)
+    
+    def _plot_is_current(self, name):
+        """Whether the PNG for plot method `name` was rendered from the current data"""
+        entry = self._plot_manifest.get(name)
+        if not isinstance(entry, dict):
+            return False
+        # Entries from an older or hand-edited manifest just count as stale
+        path = entry.get('path')
+        return (entry.get('hash') == self._df_hash
+                and entry.get('dpi') == self.dpi
+                and isinstance(path, str) and os.path.exists(path)
+                and os.path.getmtime(path) == entry.get('mtime'))
+    
+    def _record_plot(self, name):
+        filename = getattr(type(self), name).plot_file
+        self._plot_manifest[name] = {'hash': self._df_hash, 'dpi': self.dpi,
+                                     'path': filename,
+                                     'mtime': os.path.getmtime(filename)}
+        self._save_plot_manifest()
+    
+    @cached_property
+    def _df_hash(self):
+        return str(pd.util.hash_pandas_object(self.df).sum())
+    
+    @cached_property
+    def _formatted_table(self):
+        return self.df.to_string(index=False)
+    
+    @cached_property
+    def _rate_summary(self):
+        """Crime rate statistics for the dashboard, computed in one agg() call"""
+        stats = self.df['Crime_Rate'].agg(['mean', 'median', 'std', 'min', 'max']).to_dict()
+        # idxmax/idxmin skip the NaN rates that blank count cells produce
+        rates = self.df['Crime_Rate']
+        stats['highest_state'] = self.df.loc[rates.idxmax(), 'State']
+        stats['safest_state'] = self.df.loc[rates.idxmin(), 'State']
+        return stats
+    
+    @cached_property
+    def _sorted_by_rate(self):
+        return self.df.sort_values('Crime_Rate', ascending=True)
+    
+    @cached_property
+    def _top10_rate(self):
+        return self.df.nlargest(10, 'Crime_Rate')
+    
+    @cached_property
+    def _bottom10_rate(self):
+        return self.df.nsmallest(10, 'Crime_Rate')
+    
+    @cached_property
+    def _top15_total(self):
+        return self.df.nlargest(15, 'Total_Crimes')
+    
+    @cached_property
+    def _top5_rate(self):
+        return self._top10_rate.head(5)
+    
     def display_data(self):
         """Display crime statistics"""
         print("\n╔════════════════════════════════════════════════════════════════════════╗")
         print("║                    STATE-WISE CRIME STATISTICS                         ║")
         print("╚════════════════════════════════════════════════════════════════════════╝\n")
         
-        pd.set_option('display.max_columns', None)
-        pd.set_option('display.width', None)
-        pd.set_option('display.max_rows', None)
-        
-        print(self.df.to_string(index=False))
+        print(self._formatted_table)
         print("\nNote: Crime Rate = Crimes per 100,000 population")
     
-    def plot_crime_rate_by_state(self):
+    def _savefig(self, fig, filename):
+        """Save fig as PNG; screen-resolution output uses fast zlib compression"""
+        pil_kwargs = None if self.dpi >= PUBLISH_DPI else {'compress_level': 1}
+        fig.savefig(filename, dpi=self.dpi, bbox_inches='tight', pil_kwargs=pil_kwargs)
+    
+    @staticmethod
+    def _show_or_close(fig, show):
+        """Display the figure interactively, or release it in batch mode"""
+        if show:
+            plt.show()
+        else:
+            plt.close(fig)
+    
+    @cache_plot('crime_rate_by_state.png')
+    def plot_crime_rate_by_state(self, show=True):
         """Plot crime rate comparison by state"""
-        plt.figure(figsize=(14, 8))
+        fig = plt.figure(figsize=(14, 8))
         
         # Sort by crime rate
-        df_sorted = self.df.sort_values('Crime_Rate', ascending=True)
+        df_sorted = self._sorted_by_rate
         
         # Create color map (red for high, green for low)
-        colors = plt.cm.RdYlGn_r(np.linspace(0.2, 0.8, len(df_sorted)))
+        colors = _rdylgn_colors(len(df_sorted))
         
         plt.barh(df_sorted['State'], df_sorted['Crime_Rate'], color=colors)
         plt.xlabel('Crime Rate (per 100,000 population)', fontsize=12, fontweight='bold')
@@ -102,66 +405,57 @@ class CrimeAnalysisSystem:
         plt.legend()
         
         plt.tight_layout()
-        plt.savefig('crime_rate_by_state.png', dpi=300, bbox_inches='tight')
+        self._savefig(fig, 'crime_rate_by_state.png')
         print("✓ Saved: crime_rate_by_state.png")
-        plt.show()
+        self._show_or_close(fig, show)
     
-    def plot_crime_categories(self):
+    @cache_plot('crime_categories.png')
+    def plot_crime_categories(self, show=True):
         """Plot crime distribution by category"""
         fig, axes = plt.subplots(1, 2, figsize=(16, 6))
         
         # Pie chart for overall crime distribution
-        crime_totals = {
-            'Murder': self.df['Murder'].sum(),
-            'Rape': self.df['Rape'].sum(),
-            'Kidnapping': self.df['Kidnapping'].sum(),
-            'Robbery': self.df['Robbery'].sum(),
-            'Theft': self.df['Theft'].sum(),
-            'Riots': self.df['Riots'].sum()
-        }
+        crime_totals = self.df[self.CRIME_COLS].sum()
         
-        colors_pie = ['#ff6b6b', '#ee5a6f', '#c44569', '#4a69bd', '#60a3bc', '#f8b500']
-        axes[0].pie(crime_totals.values(), labels=crime_totals.keys(), autopct='%1.1f%%',
-                   startangle=90, colors=colors_pie, textprops={'fontsize': 11})
+        axes[0].pie(crime_totals.values, labels=crime_totals.index, autopct='%1.1f%%',
+                   startangle=90, colors=CATEGORY_COLORS, textprops={'fontsize': 11})
         axes[0].set_title('National Crime Distribution by Category', 
                          fontsize=13, fontweight='bold', pad=15)
         
         # Bar chart for category totals
-        categories = list(crime_totals.keys())
-        values = list(crime_totals.values())
+        categories = crime_totals.index
+        values = crime_totals.values
         
-        bars = axes[1].bar(categories, values, color=colors_pie, edgecolor='black', linewidth=1.2)
+        bars = axes[1].bar(categories, values, color=CATEGORY_COLORS, edgecolor='black', linewidth=1.2)
         axes[1].set_xlabel('Crime Category', fontsize=12, fontweight='bold')
         axes[1].set_ylabel('Total Cases', fontsize=12, fontweight='bold')
         axes[1].set_title('Total Cases by Crime Category', fontsize=13, fontweight='bold', pad=15)
         axes[1].grid(axis='y', alpha=0.3)
         
         # Add value labels on bars
-        for bar in bars:
-            height = bar.get_height()
-            axes[1].text(bar.get_x() + bar.get_width()/2., height,
-                        f'{int(height):,}',
-                        ha='center', va='bottom', fontsize=10, fontweight='bold')
+        axes[1].bar_label(bars, labels=[f'{int(v):,}' for v in values],
+                         fontsize=10, fontweight='bold')
         
         plt.xticks(rotation=45, ha='right')
         plt.tight_layout()
-        plt.savefig('crime_categories.png', dpi=300, bbox_inches='tight')
+        self._savefig(fig, 'crime_categories.png')
         print("✓ Saved: crime_categories.png")
-        plt.show()
+        self._show_or_close(fig, show)
     
-    def plot_top_bottom_states(self):
+    @cache_plot('top_bottom_states.png')
+    def plot_top_bottom_states(self, show=True):
         """Plot top 10 high crime and bottom 10 low crime states"""
         fig, axes = plt.subplots(1, 2, figsize=(16, 8))
         
         # Top 10 highest crime rate states
-        top_10 = self.df.nlargest(10, 'Crime_Rate').sort_values('Crime_Rate')
+        top_10 = self._top10_rate.iloc[::-1]
         axes[0].barh(top_10['State'], top_10['Crime_Rate'], color='#e74c3c')
         axes[0].set_xlabel('Crime Rate', fontsize=11, fontweight='bold')
         axes[0].set_title('Top 10 High Crime Rate States', fontsize=13, fontweight='bold', pad=15)
         axes[0].grid(axis='x', alpha=0.3)
         
         # Bottom 10 lowest crime rate states
-        bottom_10 = self.df.nsmallest(10, 'Crime_Rate').sort_values('Crime_Rate', ascending=False)
+        bottom_10 = self._bottom10_rate.iloc[::-1]
         axes[1].barh(bottom_10['State'], bottom_10['Crime_Rate'], color='#27ae60')
         axes[1].set_xlabel('Crime Rate', fontsize=11, fontweight='bold')
         axes[1].set_title('Top 10 Safest States (Lowest Crime Rate)', 
@@ -169,23 +463,28 @@ class CrimeAnalysisSystem:
         axes[1].grid(axis='x', alpha=0.3)
         
         plt.tight_layout()
-        plt.savefig('top_bottom_states.png', dpi=300, bbox_inches='tight')
+        self._savefig(fig, 'top_bottom_states.png')
         print("✓ Saved: top_bottom_states.png")
-        plt.show()
+        self._show_or_close(fig, show)
     
-    def plot_heatmap(self):
+    @cache_plot('crime_heatmap.png')
+    def plot_heatmap(self, show=True):
         """Create heatmap of crime categories by state"""
-        plt.figure(figsize=(12, 10))
+        fig = plt.figure(figsize=(12, 10))
         
         # Select top 15 states by total crimes
-        top_states = self.df.nlargest(15, 'Total_Crimes')
+        top_states = self._top15_total
         
         # Create data for heatmap
-        heatmap_data = top_states[['State', 'Murder', 'Rape', 'Kidnapping', 
-                                   'Robbery', 'Theft', 'Riots']].set_index('State')
+        heatmap_data = top_states[['State'] + self.CRIME_COLS].set_index('State')
         
-        # Normalize data for better visualization
-        heatmap_normalized = (heatmap_data - heatmap_data.min()) / (heatmap_data.max() - heatmap_data.min())
+        # Min-max normalize each column in one pass over the raw array
+        arr = heatmap_data.to_numpy(dtype=np.float32)
+        lo = arr.min(axis=0)
+        rng = arr.max(axis=0) - lo
+        rng[rng == 0] = 1  # constant columns map to 0 instead of NaN
+        heatmap_normalized = pd.DataFrame((arr - lo) / rng, index=heatmap_data.index,
+                                          columns=heatmap_data.columns)
         
         sns.heatmap(heatmap_normalized, annot=True, fmt='.2f', cmap='YlOrRd', 
                    linewidths=0.5, cbar_kws={'label': 'Normalized Crime Intensity'})
@@ -195,13 +494,14 @@ class CrimeAnalysisSystem:
         plt.ylabel('State', fontsize=12, fontweight='bold')
         plt.xticks(rotation=45, ha='right')
         plt.tight_layout()
-        plt.savefig('crime_heatmap.png', dpi=300, bbox_inches='tight')
+        self._savefig(fig, 'crime_heatmap.png')
         print("✓ Saved: crime_heatmap.png")
-        plt.show()
+        self._show_or_close(fig, show)
     
-    def plot_population_vs_crime(self):
+    @cache_plot('population_vs_crime.png')
+    def plot_population_vs_crime(self, show=True):
         """Scatter plot: Population vs Total Crimes"""
-        plt.figure(figsize=(12, 8))
+        fig = plt.figure(figsize=(12, 8))
         
         # Create scatter plot
         scatter = plt.scatter(self.df['Population_Lakhs'], self.df['Total_Crimes'],
@@ -209,10 +509,11 @@ class CrimeAnalysisSystem:
                             cmap='RdYlGn_r', edgecolors='black', linewidth=1.5)
         
         # Add state labels for top 10 crime states
-        top_10_crime = self.df.nlargest(10, 'Total_Crimes')
-        for idx, row in top_10_crime.iterrows():
-            plt.annotate(row['State'], 
-                        (row['Population_Lakhs'], row['Total_Crimes']),
+        top_10_crime = self._top15_total.head(10)
+        for state, pop, total in zip(top_10_crime['State'].to_numpy(),
+                                     top_10_crime['Population_Lakhs'].to_numpy(),
+                                     top_10_crime['Total_Crimes'].to_numpy()):
+            plt.annotate(state, (pop, total),
                         xytext=(5, 5), textcoords='offset points',
                         fontsize=9, alpha=0.8)
         
@@ -223,22 +524,25 @@ class CrimeAnalysisSystem:
                  fontsize=14, fontweight='bold', pad=20)
         plt.grid(True, alpha=0.3)
         plt.tight_layout()
-        plt.savefig('population_vs_crime.png', dpi=300, bbox_inches='tight')
+        self._savefig(fig, 'population_vs_crime.png')
         print("✓ Saved: population_vs_crime.png")
-        plt.show()
+        self._show_or_close(fig, show)
     
-    def plot_statistical_summary(self):
+    @cache_plot('statistical_dashboard.png')
+    def plot_statistical_summary(self, show=True):
         """Create statistical summary dashboard"""
         fig = plt.figure(figsize=(16, 10))
         gs = fig.add_gridspec(3, 3, hspace=0.3, wspace=0.3)
         
+        stats = self._rate_summary
+        
         # 1. Crime Rate Distribution
         ax1 = fig.add_subplot(gs[0, :2])
         ax1.hist(self.df['Crime_Rate'], bins=15, color='#3498db', edgecolor='black', alpha=0.7)
-        ax1.axvline(self.df['Crime_Rate'].mean(), color='red', linestyle='--', 
-                   linewidth=2, label=f"Mean: {self.df['Crime_Rate'].mean():.2f}")
-        ax1.axvline(self.df['Crime_Rate'].median(), color='green', linestyle='--', 
-                   linewidth=2, label=f"Median: {self.df['Crime_Rate'].median():.2f}")
+        ax1.axvline(stats['mean'], color='red', linestyle='--', 
+                   linewidth=2, label=f"Mean: {stats['mean']:.2f}")
+        ax1.axvline(stats['median'], color='green', linestyle='--', 
+                   linewidth=2, label=f"Median: {stats['median']:.2f}")
         ax1.set_xlabel('Crime Rate', fontsize=11, fontweight='bold')
         ax1.set_ylabel('Frequency', fontsize=11, fontweight='bold')
         ax1.set_title('Crime Rate Distribution', fontsize=12, fontweight='bold')
@@ -256,29 +560,29 @@ class CrimeAnalysisSystem:
         Total Crimes: {self.df['Total_Crimes'].sum():,}
         
         Crime Rate Stats:
-        • Mean: {self.df['Crime_Rate'].mean():.2f}
-        • Median: {self.df['Crime_Rate'].median():.2f}
-        • Std Dev: {self.df['Crime_Rate'].std():.2f}
-        • Min: {self.df['Crime_Rate'].min():.2f}
-        • Max: {self.df['Crime_Rate'].max():.2f}
+        • Mean: {stats['mean']:.2f}
+        • Median: {stats['median']:.2f}
+        • Std Dev: {stats['std']:.2f}
+        • Min: {stats['min']:.2f}
+        • Max: {stats['max']:.2f}
         
         Highest Crime State:
-        {self.df.loc[self.df['Crime_Rate'].idxmax(), 'State']}
+        {stats['highest_state']}
         
         Safest State:
-        {self.df.loc[self.df['Crime_Rate'].idxmin(), 'State']}
+        {stats['safest_state']}
         """
         ax2.text(0.1, 0.5, stats_text, fontsize=10, family='monospace',
                 verticalalignment='center')
         
         # 3. Box plot for crime categories
         ax3 = fig.add_subplot(gs[1, :])
-        crime_cols = ['Murder', 'Rape', 'Kidnapping', 'Robbery', 'Theft', 'Riots']
-        data_for_box = [self.df[col] for col in crime_cols]
+        crime_cols = self.CRIME_COLS
+        # A 2D array is read column-wise by boxplot: one box per crime category
+        data_for_box = self.df[crime_cols].to_numpy(dtype=np.float64)
         bp = ax3.boxplot(data_for_box, labels=crime_cols, patch_artist=True)
         
-        colors_box = ['#ff6b6b', '#ee5a6f', '#c44569', '#4a69bd', '#60a3bc', '#f8b500']
-        for patch, color in zip(bp['boxes'], colors_box):
+        for patch, color in zip(bp['boxes'], CATEGORY_COLORS):
             patch.set_facecolor(color)
             patch.set_alpha(0.7)
         
@@ -288,40 +592,64 @@ class CrimeAnalysisSystem:
         
         # 4. Top 5 crime categories by state
         ax4 = fig.add_subplot(gs[2, :])
-        top_5 = self.df.nlargest(5, 'Crime_Rate')
-        x = np.arange(len(top_5))
-        width = 0.15
-        
-        for i, col in enumerate(crime_cols):
-            ax4.bar(x + i*width, top_5[col], width, label=col, alpha=0.8)
+        top_5 = self._top5_rate.set_index('State')[crime_cols]
+        top_5.plot.bar(ax=ax4, width=0.9, color=list(CATEGORY_COLORS), alpha=0.8)
         
         ax4.set_xlabel('State', fontsize=11, fontweight='bold')
         ax4.set_ylabel('Number of Cases', fontsize=11, fontweight='bold')
         ax4.set_title('Crime Distribution in Top 5 High-Crime States', 
                      fontsize=12, fontweight='bold')
-        ax4.set_xticks(x + width * 2.5)
-        ax4.set_xticklabels(top_5['State'], rotation=45, ha='right')
+        ax4.set_xticklabels(top_5.index, rotation=45, ha='right')
         ax4.legend(loc='upper right', ncol=3)
         ax4.grid(axis='y', alpha=0.3)
         
         plt.suptitle('Crime Analysis Statistical Dashboard (SDG 16)', 
                     fontsize=16, fontweight='bold', y=0.995)
-        plt.savefig('statistical_dashboard.png', dpi=300, bbox_inches='tight')
+        self._savefig(fig, 'statistical_dashboard.png')
         print("✓ Saved: statistical_dashboard.png")
-        plt.show()
+        self._show_or_close(fig, show)
     
-    def generate_all_visualizations(self):
-        """Generate all visualizations at once"""
+    def generate_all_visualizations(self, batch=False):
+        """Generate all visualizations at once and save them without displaying
+        
+        For large datasets, stale plots are rendered concurrently in worker
+        processes. With batch=True this process also switches to the
+        non-interactive Agg backend for the duration of the call, so no GUI
+        toolkit is used.
+        """
+        if not batch:
+            self._render_all_plots()
+            return
+        
+        _ensure_plotting()
+        previous_backend = plt.get_backend()
+        plt.switch_backend('Agg')
+        try:
+            self._render_all_plots()
+        finally:
+            # Later menu plots in the same session can still be displayed
+            plt.switch_backend(previous_backend)
+    
+    def _render_all_plots(self):
         print("\n" + "="*60)
         print("Generating All Visualizations...")
         print("="*60 + "\n")
         
-        self.plot_crime_rate_by_state()
-        self.plot_crime_categories()
-        self.plot_top_bottom_states()
-        self.plot_heatmap()
-        self.plot_population_vs_crime()
-        self.plot_statistical_summary()
+        stale = [name for name in self.PLOT_METHODS if not self._plot_is_current(name)]
+        if (len(stale) > 1 and len(self.df) >= PARALLEL_RENDER_MIN_ROWS
+                and (os.cpu_count() or 1) > 1):
+            # The figures are independent, so render the stale ones in parallel
+            workers = min(len(stale), os.cpu_count() or 1)
+            with ProcessPoolExecutor(workers, mp_context=get_context('spawn')) as pool:
+                futures = [(name, pool.submit(_render_plot, self.df, name, self.dpi)) for name in stale]
+                for name, future in futures:
+                    future.result()
+                    self._record_plot(name)
+        else:
+            for name in self.PLOT_METHODS:
+                getattr(self, name)(show=False)
+        if plt is not None:
+            plt.close('all')
         
         print("\n" + "="*60)
         print("✅ All visualizations generated successfully!")
@@ -381,9 +709,16 @@ class CrimeAnalysisSystem:
 
 # Main execution
 if __name__ == "__main__":
-    # Set style for better-looking plots
-    plt.style.use('seaborn-v0_8-darkgrid')
-    sns.set_palette("husl")
+    # --publish saves charts at print resolution instead of screen resolution
+    dpi = PUBLISH_DPI if '--publish' in sys.argv[1:] else SCREEN_DPI
+    
+    # No terminal attached (e.g. scripted runs): render off-screen
+    if not sys.stdin.isatty():
+        os.environ['MPLBACKEND'] = 'Agg'
     
-    system = CrimeAnalysisSystem('crime_data.csv')
-    system.run()
\ No newline at end of file
+    system = CrimeAnalysisSystem('crime_data.csv', dpi=dpi)
+    # --batch saves every chart off-screen and exits without the menu
+    if '--batch' in sys.argv[1:]:
+        system.generate_all_visualizations(batch=True)
+    else:
+        system.run()
\ No newline at end of file